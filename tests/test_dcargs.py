@@ -219,6 +219,37 @@ def test_default_factory() -> None:
     assert tyro.cli(A, args=[]) == A()
 
 
+def test_default_factory_fresh_per_call() -> None:
+    """Each `tyro.cli()` call should invoke default factories anew; results from
+    repeated calls must not share (or observe mutations of) a factory product."""
+
+    @dataclasses.dataclass
+    class A:
+        items: List[int] = dataclasses.field(default_factory=lambda: [1, 2])
+
+    first = tyro.cli(A, args=[])
+    assert first.items == [1, 2]
+    first.items.append(99)
+
+    second = tyro.cli(A, args=[])
+    assert second.items == [1, 2]
+    assert second.items is not first.items
+
+
+def test_mutable_default_instance_mutated_between_calls() -> None:
+    """In-place mutations of a (hashable, eq=False) default instance should be
+    reflected by later `tyro.cli()` calls."""
+
+    @dataclasses.dataclass(eq=False)
+    class A:
+        x: int = 1
+
+    default = A()
+    assert tyro.cli(A, args=[], default=default).x == 1
+    default.x = 5
+    assert tyro.cli(A, args=[], default=default).x == 5
+
+
 def test_optional() -> None:
     @dataclasses.dataclass
     class A:
@@ -149,7 +149,7 @@ def _rule_handle_defaults(
     """Set `required=True` if a default value is set."""
 
     # Mark lowered as required if a default is set.
-    if arg.field.default in _fields.MISSING_SINGLETONS:
+    if _fields.is_missing(arg.field.default):
         return dataclasses.replace(lowered, default=None, required=True)
 
     return dataclasses.replace(lowered, default=arg.field.default)
@@ -163,7 +163,7 @@ def _rule_handle_boolean_flags(
         return lowered
 
     if (
-        arg.field.default in _fields.MISSING_SINGLETONS
+        _fields.is_missing(arg.field.default)
         or arg.field.is_positional()
         or _markers.FlagConversionOff in arg.field.markers
         or _markers.Fixed in arg.field.markers
@@ -219,7 +219,7 @@ def _rule_recursive_instantiator_from_type(
             arg.type_from_typevar,
         )
     except _instantiators.UnsupportedTypeAnnotationError as e:
-        if arg.field.default in _fields.MISSING_SINGLETONS:
+        if _fields.is_missing(arg.field.default):
             raise _instantiators.UnsupportedTypeAnnotationError(
                 "Unsupported type annotation for the field"
                 f" {_strings.make_field_name([arg.name_prefix, arg.field.name])}. To"
@@ -265,7 +265,7 @@ def _rule_convert_defaults_to_strings(
 
     if (
         lowered.default is None
-        or lowered.default in _fields.MISSING_SINGLETONS
+        or _fields.is_missing(lowered.default)
         or lowered.action is not None
     ):
         return lowered
@@ -315,7 +315,7 @@ def _rule_generate_helptext(
     if lowered.is_fixed():
         # For fixed args, we'll be missing the lowered default. Use field default
         # instead.
-        assert default in _fields.MISSING_SINGLETONS
+        assert _fields.is_missing(default)
         default = arg.field.default
 
     if not lowered.required:
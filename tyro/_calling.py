@@ -42,11 +42,10 @@ def call_from_args(
         assert prefixed_field_name in value_from_prefixed_field_name
         return value_from_prefixed_field_name[prefixed_field_name]
 
-    arg_from_prefixed_field_name: Dict[str, _arguments.ArgumentDefinition] = {}
-    for arg in parser_definition.args:
-        arg_from_prefixed_field_name[
-            _strings.make_field_name([arg.dest_prefix, arg.field.name])
-        ] = arg
+    arg_from_prefixed_field_name: Dict[str, _arguments.ArgumentDefinition] = {
+        _strings.make_field_name([arg.dest_prefix, arg.field.name]): arg
+        for arg in parser_definition.args
+    }
 
     for field in _fields.field_list_from_callable(
         f, default_instance=default_instance
@@ -66,7 +65,7 @@ def call_from_args(
             if not arg.lowered.is_fixed():
                 value = get_value_from_arg(prefixed_field_name)
 
-                if value in _fields.MISSING_SINGLETONS:
+                if _fields.is_missing(value):
                     value = arg.field.default
                 else:
                     if arg.lowered.nargs == "?":
@@ -82,10 +81,10 @@ def call_from_args(
                             f"Parsing error for {arg.lowered.name_or_flag}: {e.args[0]}"
                         )
             else:
-                assert arg.field.default not in _fields.MISSING_SINGLETONS
+                assert not _fields.is_missing(arg.field.default)
                 value = arg.field.default
                 parsed_value = value_from_prefixed_field_name.get(prefixed_field_name)
-                if parsed_value not in _fields.MISSING_SINGLETONS:
+                if not _fields.is_missing(parsed_value):
                     raise InstantiationError(
                         f"{arg.lowered.name_or_flag}={parsed_value} was passed in, but"
                         " is a fixed argument that cannot be parsed"
@@ -115,7 +114,7 @@ def call_from_args(
             if subparser_dest in value_from_prefixed_field_name:
                 subparser_name = get_value_from_arg(subparser_dest)
             else:
-                assert subparser_def.default_instance not in _fields.MISSING_SINGLETONS
+                assert not _fields.is_missing(subparser_def.default_instance)
                 default_instance = subparser_def.default_instance
                 # assert default_instance is not None
                 subparser_name = None
@@ -274,7 +274,7 @@ def _cli_impl(
     parser_definition = _parsers.ParserSpecification.from_callable_or_type(
         f,
         description=description,
-        parent_classes=set(),  # Used for recursive calls.
+        parent_classes=frozenset(),  # Used for recursive calls.
         default_instance=default_instance_internal,  # Overrides for default values.
         prefix="",  # Used for recursive calls.
         subcommand_prefix="",  # Used for recursive calls.
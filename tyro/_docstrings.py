@@ -27,7 +27,7 @@ from . import _resolver, _strings
 T = TypeVar("T", bound=Callable)
 
 # Cast for making types more lenient.
-_cache = cast(Callable[[int], Callable[[T], T]], functools.lru_cache)
+_cache = cast(Callable[[Optional[int]], Callable[[T], T]], functools.lru_cache)
 
 
 @dataclasses.dataclass(frozen=True)
@@ -95,7 +95,8 @@ class _ClassTokenization:
                 # Naive heuristic for field names.
                 is_first_token = True
                 for t in tokens_from_logical_line[token.logical_line]:
-                    if t == token:
+                    # Identity check: the same token object is stored in both indices.
+                    if t is token:
                         break
                     if t.token_type is not tokenize.COMMENT:
                         is_first_token = False
@@ -167,7 +168,7 @@ def get_class_tokenization_with_field(
     return tokenization
 
 
-@_cache(256)
+@_cache(None)
 def get_field_docstring(cls: Type, field_name: str) -> Optional[str]:
     """Get docstring for a field in a class."""
 
@@ -14,12 +14,15 @@ import warnings
 from typing import (
     Any,
     Callable,
+    Dict,
     FrozenSet,
     Hashable,
     Iterable,
     List,
     Optional,
+    Set,
     Tuple,
+    TypeVar,
     Union,
     cast,
 )
@@ -36,6 +39,19 @@ from .conf import _confstruct, _markers
 
 @dataclasses.dataclass(frozen=True)
 class FieldDefinition:
+    # Field definitions are allocated for every input of every nested callable;
+    # skipping the per-instance `__dict__` saves memory and speeds up attribute
+    # access. (`dataclasses.dataclass(slots=True)` requires Python >=3.10)
+    __slots__ = (
+        "name",
+        "typ",
+        "default",
+        "helptext",
+        "markers",
+        "argconf",
+        "call_argname",
+    )
+
     name: str
     typ: TypeForm[Any]
     default: Any
@@ -51,7 +67,7 @@ class FieldDefinition:
     def __post_init__(self):
         if (
             _markers.Fixed in self.markers or _markers.Suppress in self.markers
-        ) and self.default in MISSING_SINGLETONS:
+        ) and is_missing(self.default):
             raise _instantiators.UnsupportedTypeAnnotationError(
                 f"Field {self.name} is missing a default value!"
             )
@@ -66,8 +82,17 @@ class FieldDefinition:
         *,
         markers: Tuple[_markers._Marker, ...] = (),
     ):
-        # Try to extract argconf overrides from type.
-        _, argconfs = _resolver.unwrap_annotated(typ, _confstruct._ArgConfiguration)
+        # Try to extract argconf overrides and markers from the type. This walks the
+        # `Annotated[...]` metadata once; calling `_resolver.unwrap_annotated()` for
+        # each metadata type would traverse it twice.
+        argconfs = []
+        inferred_markers = []
+        for meta in getattr(typ, "__metadata__", ()):
+            if isinstance(meta, _confstruct._ArgConfiguration):
+                argconfs.append(meta)
+            elif isinstance(meta, _markers._Marker):
+                inferred_markers.append(meta)
+
         if len(argconfs) == 0:
             argconf = _confstruct._ArgConfiguration(None, None, None)
         else:
@@ -75,7 +100,8 @@ class FieldDefinition:
             (argconf,) = argconfs
             helptext = argconf.help
 
-        typ, inferred_markers = _resolver.unwrap_annotated(typ, _markers._Marker)
+        if hasattr(typ, "__metadata__"):
+            typ = get_args(typ)[0]
         return FieldDefinition(
             name if argconf.name is None else argconf.name,
             typ,
@@ -87,10 +113,38 @@ class FieldDefinition:
         )
 
     def add_markers(self, markers: Tuple[_markers._Marker, ...]) -> FieldDefinition:
-        return dataclasses.replace(
-            self,
-            markers=self.markers.union(markers),
-        )
+        if len(markers) == 0 or self.markers.issuperset(markers):
+            # No-op; skip reconstructing the (frozen) field.
+            return self
+        # Construct directly instead of via `dataclasses.replace()`, which reflects
+        # over all fields and re-binds them through `__init__`. We still re-run
+        # `__post_init__`, since its validation depends on the markers.
+        out = object.__new__(FieldDefinition)
+        object.__setattr__(out, "name", self.name)
+        object.__setattr__(out, "typ", self.typ)
+        object.__setattr__(out, "default", self.default)
+        object.__setattr__(out, "helptext", self.helptext)
+        object.__setattr__(out, "markers", self.markers.union(markers))
+        object.__setattr__(out, "argconf", self.argconf)
+        object.__setattr__(out, "call_argname", self.call_argname)
+        out.__post_init__()
+        return out
+
+    def with_typ(self, typ: Union[TypeForm[Any], TypeVar]) -> FieldDefinition:
+        """Return a copy of this field with the type swapped out. Cheaper than
+        `dataclasses.replace()`, which re-runs `__init__` and `__post_init__`; the
+        validation there only depends on markers and defaults, which are unchanged."""
+        if typ is self.typ:
+            return self
+        out = object.__new__(FieldDefinition)
+        object.__setattr__(out, "name", self.name)
+        object.__setattr__(out, "typ", typ)
+        object.__setattr__(out, "default", self.default)
+        object.__setattr__(out, "helptext", self.helptext)
+        object.__setattr__(out, "markers", self.markers)
+        object.__setattr__(out, "argconf", self.argconf)
+        object.__setattr__(out, "call_argname", self.call_argname)
+        return out
 
     def is_positional(self) -> bool:
         """Returns True if the argument should be positional in the commandline."""
@@ -152,6 +206,68 @@ try:
 except ImportError:
     pass
 
+_MISSING_SINGLETON_IDS = frozenset(map(id, MISSING_SINGLETONS))
+
+
+def is_missing(value: Any) -> bool:
+    """Check if a value is one of the missing sentinels in `MISSING_SINGLETONS`.
+
+    Equivalent to `value in MISSING_SINGLETONS`, but avoids invoking (potentially
+    expensive) user-defined `__eq__` methods, eg field-by-field comparison against a
+    large default instance. omegaconf's MISSING sentinel is a plain string, so strings
+    still go through an equality check."""
+    return id(value) in _MISSING_SINGLETON_IDS or (
+        type(value) is str and value in MISSING_SINGLETONS
+    )
+
+
+def _has_real_default(default_instance: Any) -> bool:
+    """Check if a default is a concrete value: not a missing sentinel, not excluded
+    from the call, and not None."""
+    return (
+        not is_missing(default_instance)
+        and default_instance is not EXCLUDE_FROM_CALL
+        and default_instance is not None
+    )
+
+
+# Types whose instances are immutable and hash by value.
+_IMMUTABLE_DEFAULT_TYPES = (
+    bool,
+    int,
+    float,
+    complex,
+    str,
+    bytes,
+    type(None),
+    enum.Enum,
+)
+
+
+def is_cache_safe_default(default_instance: Any) -> bool:
+    """Check if a default instance is safe to embed in a cache key.
+
+    Hashability isn't enough: a mutable object that hashes by identity (eg a dataclass
+    instance with `eq=False`) would produce stale cache hits after in-place mutation.
+    Only values known to be immutable qualify: missing sentinels, scalars, enums, and
+    frozen dataclass instances."""
+    if is_missing(default_instance) or default_instance is EXCLUDE_FROM_CALL:
+        return True
+    if isinstance(default_instance, _IMMUTABLE_DEFAULT_TYPES):
+        return True
+    return (
+        not isinstance(default_instance, type)
+        and dataclasses.is_dataclass(default_instance)
+        and type(default_instance).__dataclass_params__.frozen  # type: ignore
+    )
+
+
+# Incremented whenever a field default is produced by invoking a default factory.
+# Factory products must be fresh on every call -- sharing them would alias mutable
+# state across otherwise-independent `tyro.cli()` results -- so caches snapshot this
+# counter around construction and skip storing results whose construction bumped it.
+_default_factory_invocations = 0
+
 
 @dataclasses.dataclass(frozen=True)
 class UnsupportedNestedTypeMessage:
@@ -181,10 +297,13 @@ def field_list_from_callable(
     if isinstance(out, UnsupportedNestedTypeMessage):
         raise _instantiators.UnsupportedTypeAnnotationError(out.message)
 
-    # Recursively apply markers.
+    # Recursively apply markers. Skipped entirely in the common unannotated case;
+    # note that callers must not mutate the returned list (see the cache in
+    # `_try_field_list_from_callable`).
     _, parent_markers = _resolver.unwrap_annotated(f, _markers._Marker)
-    out = list(map(lambda field: field.add_markers(parent_markers), out))
-    return out
+    if len(parent_markers) == 0:
+        return out
+    return list(map(lambda field: field.add_markers(parent_markers), out))
 
 
 # Implementation details below.
@@ -205,11 +324,60 @@ _known_parsable_types = set(
         ),
     )
 )
+_known_parsable_type_ids = frozenset(map(id, _known_parsable_types))
+
+
+def _is_known_parsable_type(x: Any) -> bool:
+    # Identity fast path: hashing generic aliases from the typing module can be
+    # surprisingly expensive, and membership candidates are almost always the interned
+    # objects collected above. The equality-based check remains as a fallback.
+    return id(x) in _known_parsable_type_ids or x in _known_parsable_types
+
+
+_field_list_cache: Dict[
+    Any, Union[List[FieldDefinition], UnsupportedNestedTypeMessage]
+] = {}
+_FIELD_LIST_CACHE_MAX_ENTRIES = 4096
 
 
 def _try_field_list_from_callable(
     f: Union[Callable, TypeForm[Any]],
     default_instance: _DefaultInstance,
+) -> Union[List[FieldDefinition], UnsupportedNestedTypeMessage]:
+    # Memoized when safe: `is_nested_type()` calls this purely to check whether it
+    # succeeds, and `field_list_from_callable()` then repeats the same work. The result
+    # is pure on `(f, default_instance)`; callers must not mutate the returned list.
+    # The default's type is part of the key to avoid conflating hash-equal defaults of
+    # different types (eg True and 1), which type narrowing distinguishes. Results
+    # whose construction invoked a default factory are never cached, since factory
+    # products must be fresh on every call.
+    cache_key = None
+    if is_cache_safe_default(default_instance):
+        try:
+            candidate = (f, type(default_instance), default_instance)
+            hash(candidate)
+            cache_key = candidate
+        except TypeError:
+            # Unhashable callable; skip the cache.
+            pass
+    if cache_key is not None:
+        out = _field_list_cache.get(cache_key)
+        if out is not None:
+            return out
+
+    factory_invocations = _default_factory_invocations
+    out = _try_field_list_from_callable_impl(f, default_instance)
+    if cache_key is not None and _default_factory_invocations == factory_invocations:
+        if len(_field_list_cache) >= _FIELD_LIST_CACHE_MAX_ENTRIES:
+            # Evict the oldest entry. (dictionaries preserve insertion order)
+            _field_list_cache.pop(next(iter(_field_list_cache)))
+        _field_list_cache[cache_key] = out
+    return out
+
+
+def _try_field_list_from_callable_impl(
+    f: Union[Callable, TypeForm[Any]],
+    default_instance: _DefaultInstance,
 ) -> Union[List[FieldDefinition], UnsupportedNestedTypeMessage]:
     f, found_subcommand_configs = _resolver.unwrap_annotated(
         f, conf._confstruct._SubcommandConfiguration
@@ -264,9 +432,9 @@ def _try_field_list_from_callable(
         return _field_list_from_sequence_checked(f, default_instance)
 
     # General cases.
-    if (
-        cls is not None and cls in _known_parsable_types
-    ) or _resolver.unwrap_origin_strip_extras(f) in _known_parsable_types:
+    if (cls is not None and _is_known_parsable_type(cls)) or _is_known_parsable_type(
+        _resolver.unwrap_origin_strip_extras(f)
+    ):
         return UnsupportedNestedTypeMessage(f"{f} should be parsed directly!")
     else:
         return _try_field_list_from_general_callable(f, cls, default_instance)
@@ -276,12 +444,9 @@ def _field_list_from_typeddict(
     cls: TypeForm[Any], default_instance: _DefaultInstance
 ) -> Union[List[FieldDefinition], UnsupportedNestedTypeMessage]:
     field_list = []
-    valid_default_instance = (
-        default_instance not in MISSING_SINGLETONS
-        and default_instance is not EXCLUDE_FROM_CALL
-    )
+    valid_default_instance = _has_real_default(default_instance)
     assert not valid_default_instance or isinstance(default_instance, dict)
-    for name, typ in get_type_hints(cls, include_extras=True).items():
+    for name, typ in _resolver.cached_type_hints(cls).items():  # type: ignore
         if valid_default_instance:
             default = default_instance.get(name, MISSING_PROP)  # type: ignore
         elif getattr(cls, "__total__") is False:
@@ -316,7 +481,7 @@ def _field_list_from_namedtuple(
     field_defaults = getattr(cls, "_field_defaults")
 
     # Note that _field_types is removed in Python 3.9.
-    for name, typ in get_type_hints(cls, include_extras=True).items():
+    for name, typ in _resolver.cached_type_hints(cls).items():  # type: ignore
         # Get default, with priority for `default_instance`.
         default = field_defaults.get(name, MISSING_NONPROP)
         if hasattr(default_instance, name):
@@ -335,12 +500,19 @@ def _field_list_from_namedtuple(
     return field_list
 
 
+@functools.lru_cache(maxsize=None)
+def _resolved_init_fields(cls: TypeForm[Any]) -> Tuple[dataclasses.Field, ...]:
+    """Resolved dataclass fields with `init=True`, memoized per class; the same
+    dataclass is often reused at many sites in a nested configuration."""
+    return tuple(field for field in _resolver.resolved_fields(cls) if field.init)  # type: ignore
+
+
 def _field_list_from_dataclass(
     cls: TypeForm[Any], default_instance: _DefaultInstance
 ) -> Union[List[FieldDefinition], UnsupportedNestedTypeMessage]:
     # Handle dataclasses.
     field_list = []
-    for dc_field in filter(lambda field: field.init, _resolver.resolved_fields(cls)):
+    for dc_field in _resolved_init_fields(cls):  # type: ignore
         default = _get_dataclass_field_default(dc_field, default_instance)
 
         # Try to get helptext from field metadata. This is also intended to be
@@ -382,19 +554,29 @@ def _field_list_from_pydantic(
     assert pydantic is not None
 
     # Handle pydantic models.
-    field_list = []
-    for pd_field in cls.__fields__.values():  # type: ignore
-        field_list.append(
-            FieldDefinition.make(
-                name=pd_field.name,
-                typ=pd_field.outer_type_,
-                default=MISSING_NONPROP
-                if pd_field.required
-                else pd_field.get_default(),
-                helptext=pd_field.field_info.description,
-            )
+    return [
+        FieldDefinition.make(
+            name=pd_field.name,
+            typ=pd_field.outer_type_,
+            default=MISSING_NONPROP
+            if pd_field.required
+            else _get_pydantic_field_default(pd_field),
+            helptext=pd_field.field_info.description,
         )
-    return field_list
+        for pd_field in cls.__fields__.values()  # type: ignore
+    ]
+
+
+def _get_pydantic_field_default(pd_field: Any) -> Any:
+    """Resolve the default value of a (non-required) pydantic field."""
+    if getattr(
+        pd_field, "default_factory", None
+    ) is not None or not is_cache_safe_default(pd_field.default):
+        # pydantic hands out a fresh (deep-copied or factory-built) default per call;
+        # count it as a factory product so caches preserve that freshness.
+        global _default_factory_invocations
+        _default_factory_invocations += 1
+    return pd_field.get_default()
 
 
 try:
@@ -413,32 +595,36 @@ def _field_list_from_attrs(
     assert attr is not None
 
     # Handle attr classes.
-    field_list = []
-    for attr_field in attr.fields(cls):
-        # Default handling.
-        default = attr_field.default
-        if default is attr.NOTHING:
-            default = MISSING_NONPROP
-        elif isinstance(default, attr.Factory):  # type: ignore
-            default = default.factory()  # type: ignore
-
-        assert attr_field.type is not None
-        field_list.append(
-            FieldDefinition.make(
-                name=attr_field.name,
-                typ=attr_field.type,
-                default=default,
-                helptext=_docstrings.get_field_docstring(cls, attr_field.name),
-            )
+    fields = attr.fields(cls)
+    assert all(attr_field.type is not None for attr_field in fields)
+    return [
+        FieldDefinition.make(
+            name=attr_field.name,
+            typ=attr_field.type,
+            default=_get_attrs_field_default(attr_field),
+            helptext=_docstrings.get_field_docstring(cls, attr_field.name),
         )
-    return field_list
+        for attr_field in fields
+    ]
+
+
+def _get_attrs_field_default(attr_field: Any) -> Any:
+    """Resolve the default value of an attrs field."""
+    assert attr is not None
+    default = attr_field.default
+    if default is attr.NOTHING:
+        return MISSING_NONPROP
+    elif isinstance(default, attr.Factory):  # type: ignore
+        global _default_factory_invocations
+        _default_factory_invocations += 1
+        return default.factory()  # type: ignore
+    return default
 
 
 def _field_list_from_tuple(
     f: Union[Callable, TypeForm[Any]], default_instance: _DefaultInstance
 ) -> Union[List[FieldDefinition], UnsupportedNestedTypeMessage]:
     # Fixed-length tuples.
-    field_list = []
     children = get_args(f)
     if Ellipsis in children:
         return _try_field_list_from_sequence_inner(
@@ -448,7 +634,7 @@ def _field_list_from_tuple(
     # Infer more specific type when tuple annotation isn't subscripted. This generally
     # doesn't happen
     if len(children) == 0:
-        if default_instance in MISSING_SINGLETONS:
+        if is_missing(default_instance):
             raise _instantiators.UnsupportedTypeAnnotationError(
                 "If contained types of a tuple are not specified in the annotation, a"
                 " default instance must be specified."
@@ -458,32 +644,31 @@ def _field_list_from_tuple(
             children = tuple(type(x) for x in default_instance)
 
     if (
-        default_instance in MISSING_SINGLETONS
+        is_missing(default_instance)
         # EXCLUDE_FROM_CALL indicates we're inside a TypedDict, with total=False.
         or default_instance is EXCLUDE_FROM_CALL
     ):
         default_instance = (default_instance,) * len(children)
 
-    for i, child in enumerate(children):
-        default_i = default_instance[i]  # type: ignore
-        field_list.append(
-            FieldDefinition.make(
-                # Ideally we'd have --tuple[0] instead of --tuple.0 as the command-line
-                # argument, but in practice the brackets are annoying because they
-                # require escaping.
-                name=str(i),
-                typ=child,
-                default=default_i,
-                helptext="",
-                # This should really set the positional marker, but the CLI is more
-                # intuitive for mixed nested/non-nested types in tuples when we stick
-                # with kwargs. Tuples are special-cased in _calling.py.
-            )
+    field_list = [
+        FieldDefinition.make(
+            # Ideally we'd have --tuple[0] instead of --tuple.0 as the command-line
+            # argument, but in practice the brackets are annoying because they
+            # require escaping.
+            name=str(i),
+            typ=child,
+            default=default_instance[i],  # type: ignore
+            helptext="",
+            # This should really set the positional marker, but the CLI is more
+            # intuitive for mixed nested/non-nested types in tuples when we stick
+            # with kwargs. Tuples are special-cased in _calling.py.
         )
+        for i, child in enumerate(children)
+    ]
 
-    contains_nested = False
-    for field in field_list:
-        contains_nested |= is_nested_type(field.typ, field.default)
+    contains_nested = any(
+        is_nested_type(field.typ, field.default) for field in field_list
+    )
     if not contains_nested:
         # We could also check for variable length children, which can be populated when
         # the tuple is interpreted as a nested field but not a directly parsed one.
@@ -499,7 +684,7 @@ def _field_list_from_sequence_checked(
 ) -> Union[List[FieldDefinition], UnsupportedNestedTypeMessage]:
     contained_type: Any
     if len(get_args(f)) == 0:
-        if default_instance in MISSING_SINGLETONS:
+        if is_missing(default_instance):
             raise _instantiators.UnsupportedTypeAnnotationError(
                 f"Sequence type {f} needs either an explicit type or a"
                 " default to infer from."
@@ -518,7 +703,7 @@ def _try_field_list_from_sequence_inner(
     # When no default instance is specified:
     #     If we have List[int] => this can be parsed as a single field.
     #     If we have List[SomeStruct] => OK.
-    if default_instance in MISSING_SINGLETONS and not is_nested_type(
+    if is_missing(default_instance) and not is_nested_type(
         contained_type, MISSING_NONPROP
     ):
         return UnsupportedNestedTypeMessage(
@@ -528,13 +713,27 @@ def _try_field_list_from_sequence_inner(
     # If we have a default instance:
     #     [int, int, int] => this can be parsed as a single field.
     #     [SomeStruct, int, int] => OK.
-    if isinstance(default_instance, Iterable) and all(
-        [not is_nested_type(type(x), x) for x in default_instance]
-    ):
-        return UnsupportedNestedTypeMessage(
-            f"Sequence with default {default_instance} should be parsed directly!"
-        )
-    if default_instance in MISSING_SINGLETONS:
+    if isinstance(default_instance, Iterable):
+        # The nested check is memoized per element type: for homogeneous sequences
+        # this collapses N resolver walks into one. Standard containers are excluded
+        # from the memo, since whether they're nested can depend on their contents.
+        nested_from_type: Dict[TypeForm[Any], bool] = {}
+
+        def element_is_nested(x: Any) -> bool:
+            typ = type(x)
+            if issubclass(typ, (tuple, list, set, dict)):
+                return is_nested_type(typ, x)
+            result = nested_from_type.get(typ)
+            if result is None:
+                result = is_nested_type(typ, x)
+                nested_from_type[typ] = result
+            return result
+
+        if not any(map(element_is_nested, default_instance)):
+            return UnsupportedNestedTypeMessage(
+                f"Sequence with default {default_instance} should be parsed directly!"
+            )
+    if is_missing(default_instance):
         # We use the broader error type to prevent it from being caught by
         # is_possibly_nested_type(). This is for sure a bad annotation!
         raise _instantiators.UnsupportedTypeAnnotationError(
@@ -542,40 +741,55 @@ def _try_field_list_from_sequence_inner(
             " to infer length from."
         )
 
-    field_list = []
-    for i, default_i in enumerate(default_instance):  # type: ignore
-        field_list.append(
-            FieldDefinition.make(
-                name=str(i),
-                typ=contained_type,
-                default=default_i,
-                helptext="",
-            )
+    return [
+        FieldDefinition.make(
+            name=str(i),
+            typ=contained_type,
+            default=default_i,
+            helptext="",
         )
-    return field_list
+        for i, default_i in enumerate(default_instance)  # type: ignore
+    ]
 
 
 def _field_list_from_dict(
     f: Union[Callable, TypeForm[Any]],
     default_instance: _DefaultInstance,
 ) -> Union[List[FieldDefinition], UnsupportedNestedTypeMessage]:
-    if default_instance in MISSING_SINGLETONS:
+    if is_missing(default_instance):
         return UnsupportedNestedTypeMessage(
             "Nested dictionary structures must have a default instance specified."
         )
-    field_list = []
-    for k, v in cast(dict, default_instance).items():
-        field_list.append(
-            FieldDefinition.make(
-                name=str(k) if not isinstance(k, enum.Enum) else k.name,
-                typ=type(v),
-                default=v,
-                helptext=None,
-                # Dictionary specific key:
-                call_argname_override=k,
-            )
+    return [
+        FieldDefinition.make(
+            name=str(k) if not isinstance(k, enum.Enum) else k.name,
+            typ=type(v),
+            default=v,
+            helptext=None,
+            # Dictionary specific key:
+            call_argname_override=k,
         )
-    return field_list
+        for k, v in cast(dict, default_instance).items()
+    ]
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_signature(f: Callable) -> inspect.Signature:
+    """Same as `inspect.signature()`, but memoized. Signature inspection binds
+    parameters, defaults, and annotations on every call; the same callables are
+    inspected repeatedly during nested parser construction."""
+    return inspect.signature(f)
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_docstring_params(docstring: str) -> Dict[str, Optional[str]]:
+    """Map from parameter name to description, parsed from a docstring. Memoized on
+    the docstring text, which also sidesteps hashability concerns for the callable
+    itself."""
+    return {
+        param_doc.arg_name: param_doc.description
+        for param_doc in docstring_parser.parse(docstring).params
+    }
 
 
 def _try_field_list_from_general_callable(
@@ -584,7 +798,7 @@ def _try_field_list_from_general_callable(
     default_instance: _DefaultInstance,
 ) -> Union[List[FieldDefinition], UnsupportedNestedTypeMessage]:
     # Handle general callables.
-    if default_instance not in MISSING_SINGLETONS:
+    if not is_missing(default_instance):
         return UnsupportedNestedTypeMessage(
             "`default_instance` is supported only for select types:"
             " dataclasses, lists, NamedTuple, TypedDict, etc."
@@ -595,7 +809,11 @@ def _try_field_list_from_general_callable(
         return UnsupportedNestedTypeMessage(
             f"Cannot extract annotations from {f}, which is not a callable type."
         )
-    params = list(inspect.signature(f).parameters.values())
+    try:
+        params = list(_cached_signature(f).parameters.values())  # type: ignore
+    except TypeError:
+        # Unhashable callable; skip the cache.
+        params = list(inspect.signature(f).parameters.values())
     if cls is not None:
         # Ignore self parameter.
         params = params[1:]
@@ -609,12 +827,24 @@ def _try_field_list_from_general_callable(
     return out
 
 
-def _field_list_from_params(
-    f: Union[Callable, TypeForm[Any]],
-    cls: Optional[TypeForm[Any]],
-    params: List[inspect.Parameter],
-) -> Union[List[FieldDefinition], UnsupportedNestedTypeMessage]:
-    # Unwrap functools.wraps and functools.partial.
+def _unwrap_callable(
+    f: Union[Callable, TypeForm[Any]]
+) -> Tuple[Union[Callable, TypeForm[Any]], Optional[TypeForm[Any]]]:
+    """Peel `functools.wraps` and `functools.partial` layers off of a callable.
+
+    Returns the unwrapped callable and, if unwrapping lands on a class, that class.
+    Results are memoized when possible; decorator/partial chains are fixed per
+    callable."""
+    try:
+        hash(f)
+    except TypeError:
+        return _unwrap_callable_impl(f)
+    return _unwrap_callable_cached(f)  # type: ignore
+
+
+def _unwrap_callable_impl(
+    f: Union[Callable, TypeForm[Any]]
+) -> Tuple[Union[Callable, TypeForm[Any]], Optional[TypeForm[Any]]]:
     done = False
     while not done:
         done = True
@@ -626,21 +856,41 @@ def _field_list_from_params(
             done = False
 
     # Sometime functools.* is applied to a class.
+    cls = None
     if isinstance(f, type):
         cls = f
         f = f.__init__  # type: ignore
+    return f, cls
+
+
+_unwrap_callable_cached = functools.lru_cache(maxsize=None)(_unwrap_callable_impl)
+
+
+def _field_list_from_params(
+    f: Union[Callable, TypeForm[Any]],
+    cls: Optional[TypeForm[Any]],
+    params: List[inspect.Parameter],
+) -> Union[List[FieldDefinition], UnsupportedNestedTypeMessage]:
+    # Unwrap functools.wraps and functools.partial.
+    f, cls_override = _unwrap_callable(f)
+    if cls_override is not None:
+        cls = cls_override
 
     # Get type annotations, docstrings.
     docstring = inspect.getdoc(f)
-    docstring_from_arg_name = {}
-    if docstring is not None:
-        for param_doc in docstring_parser.parse(docstring).params:
-            docstring_from_arg_name[param_doc.arg_name] = param_doc.description
+    docstring_from_arg_name = (
+        {} if docstring is None else _cached_docstring_params(docstring)
+    )
     del docstring
 
-    # This will throw a type error for torch.device, typing.Dict, etc.
+    # This will throw a type error for torch.device, typing.Dict, etc. Note that the
+    # cached path also raises TypeError when `f` itself is unhashable, in which case we
+    # fall back to the uncached call.
     try:
-        hints = get_type_hints(f, include_extras=True)
+        try:
+            hints = _resolver.cached_type_hints(f)  # type: ignore
+        except TypeError:
+            hints = get_type_hints(f, include_extras=True)
     except TypeError:
         return UnsupportedNestedTypeMessage(f"Could not get hints for {f}!")
 
@@ -682,6 +932,9 @@ def _field_list_from_params(
     return field_list
 
 
+_frozen_checked_fields: Set[Tuple[Any, str]] = set()
+
+
 def _ensure_dataclass_instance_used_as_default_is_frozen(
     field: dataclasses.Field, default_instance: Any
 ) -> None:
@@ -689,6 +942,17 @@ def _ensure_dataclass_instance_used_as_default_is_frozen(
     frozen."""
     assert dataclasses.is_dataclass(default_instance)
     cls = type(default_instance)
+
+    # Only check (and potentially warn) once per class/field pair; the same defaults
+    # are revisited many times in nested structures, and warnings.warn() is
+    # surprisingly expensive even when the warning is filtered out. Keyed by class
+    # rather than instance, since non-frozen dataclass instances -- the ones we want
+    # to warn about -- generally aren't hashable.
+    key = (cls, field.name)
+    if key in _frozen_checked_fields:
+        return
+    _frozen_checked_fields.add(key)
+
     if not cls.__dataclass_params__.frozen:  # type: ignore
         warnings.warn(
             f"Mutable type {cls} is used as a default value for `{field.name}`. This is"
@@ -707,10 +971,7 @@ def _get_dataclass_field_default(
         return MISSING_PROP
 
     # Try grabbing default from parent instance.
-    if (
-        parent_default_instance not in MISSING_SINGLETONS
-        and parent_default_instance is not None
-    ):
+    if _has_real_default(parent_default_instance):
         # Populate default from some parent, eg `default_instance` in `tyro.cli()`.
         if hasattr(parent_default_instance, field.name):
             return getattr(parent_default_instance, field.name)
@@ -723,7 +984,7 @@ def _get_dataclass_field_default(
             )
 
     # Try grabbing default from dataclass field.
-    if field.default not in MISSING_SINGLETONS:
+    if not is_missing(field.default):
         default = field.default
         # Note that dataclasses.is_dataclass() will also return true for dataclass
         # _types_, not just instances.
@@ -744,6 +1005,8 @@ def _get_dataclass_field_default(
         dataclasses.is_dataclass(field.type)
         and field.default_factory is field.type
     ):
+        global _default_factory_invocations
+        _default_factory_invocations += 1
         return field.default_factory()
 
     # Otherwise, no default. This is different from MISSING, because MISSING propagates
@@ -4,13 +4,14 @@ from __future__ import annotations
 
 import argparse
 import dataclasses
+import itertools
 from typing import (
     Any,
     Callable,
     Dict,
+    FrozenSet,
     List,
     Optional,
-    Set,
     Tuple,
     Type,
     TypeVar,
@@ -34,14 +35,40 @@ from .conf import _confstruct, _markers
 
 T = TypeVar("T")
 
+_NoneType = type(None)
+
+
+# Specification caching. Building a parser specification is expensive -- it requires
+# resolving types, walking fields, parsing docstrings, etc -- and the same
+# callable/default pair is frequently revisited, for example when a generic
+# specialization is reused across several fields or Union arms. Specifications are
+# immutable once built, so it's safe to share them whenever the inputs are hashable.
+_parser_spec_cache: Dict[Any, "ParserSpecification"] = {}
+_PARSER_SPEC_CACHE_MAX_ENTRIES = 64
+
 
 @dataclasses.dataclass(frozen=True)
 class ParserSpecification:
     """Each parser contains a list of arguments and optionally some subparsers."""
 
+    # One specification is allocated per node of the parser tree; skipping the
+    # per-instance `__dict__` saves memory for large nested configurations.
+    # (`dataclasses.dataclass(slots=True)` requires Python >=3.10)
+    __slots__ = (
+        "f",
+        "description",
+        "args",
+        "helptext_from_nested_class_field_name",
+        "subparsers",
+        "subparsers_from_prefix",
+        "prefix",
+        "has_required_args",
+        "consolidate_subcommand_args",
+    )
+
     f: Callable
     description: str
-    args: List[_arguments.ArgumentDefinition]
+    args: Tuple[_arguments.ArgumentDefinition, ...]
     helptext_from_nested_class_field_name: Dict[str, Optional[str]]
 
     # We have two mechanics for tracking subparser groups:
@@ -59,7 +86,7 @@ class ParserSpecification:
     def from_callable_or_type(
         f: Callable[..., T],
         description: Optional[str],
-        parent_classes: Set[Type[Any]],
+        parent_classes: FrozenSet[Type[Any]],
         default_instance: Union[
             T, _fields.PropagatingMissingType, _fields.NonpropagatingMissingType
         ],
@@ -68,6 +95,65 @@ class ParserSpecification:
     ) -> ParserSpecification:
         """Create a parser definition from a callable or type."""
 
+        # Check the specification cache. Note that the cache key includes the rich
+        # formatting flag, since generated helptext depends on it. Only provably
+        # immutable default instances are safe to key on: a mutable default that
+        # hashes by identity (eg a dataclass with eq=False) would keep returning the
+        # spec built before it was mutated in place.
+        cache_key = None
+        if _fields.is_cache_safe_default(default_instance):
+            try:
+                candidate = (
+                    f,
+                    description,
+                    parent_classes,
+                    default_instance,
+                    prefix,
+                    subcommand_prefix,
+                    _arguments.USE_RICH,
+                )
+                hash(candidate)
+                cache_key = candidate
+            except TypeError:
+                # Unhashable input. Skip the cache.
+                pass
+        if cache_key is not None and cache_key in _parser_spec_cache:
+            return _parser_spec_cache[cache_key]
+
+        # Specs whose construction invoked a default factory embed the factory's
+        # product in their argument defaults; those must be rebuilt (and the factory
+        # re-run) on every call, so they're never cached.
+        factory_invocations = _fields._default_factory_invocations
+        out = ParserSpecification._from_callable_or_type(
+            f,
+            description=description,
+            parent_classes=parent_classes,
+            default_instance=default_instance,
+            prefix=prefix,
+            subcommand_prefix=subcommand_prefix,
+        )
+
+        if (
+            cache_key is not None
+            and _fields._default_factory_invocations == factory_invocations
+        ):
+            if len(_parser_spec_cache) >= _PARSER_SPEC_CACHE_MAX_ENTRIES:
+                # Evict the oldest entry. (dictionaries preserve insertion order)
+                _parser_spec_cache.pop(next(iter(_parser_spec_cache)))
+            _parser_spec_cache[cache_key] = out
+        return out
+
+    @staticmethod
+    def _from_callable_or_type(
+        f: Callable[..., T],
+        description: Optional[str],
+        parent_classes: FrozenSet[Type[Any]],
+        default_instance: Union[
+            T, _fields.PropagatingMissingType, _fields.NonpropagatingMissingType
+        ],
+        prefix: str,
+        subcommand_prefix: str = "",
+    ) -> ParserSpecification:
         # Consolidate subcommand types.
         consolidate_subcommand_args = (
             _markers.ConsolidateSubcommandArgs
@@ -93,8 +179,8 @@ class ParserSpecification:
         parent_classes = parent_classes | {cast(Type, f)}
 
         has_required_args = False
-        args = []
-        helptext_from_nested_class_field_name = {}
+        args: List[_arguments.ArgumentDefinition] = []
+        helptext_from_nested_class_field_name: Dict[str, Optional[str]] = {}
 
         subparsers = None
         subparsers_from_prefix = {}
@@ -103,19 +189,19 @@ class ParserSpecification:
             f=f, default_instance=default_instance
         )
         for field in field_list:
-            field = dataclasses.replace(
-                field,
-                # Resolve generic types.
-                typ=_resolver.narrow_container_types(
-                    _resolver.type_from_typevar_constraints(  # type: ignore
-                        _resolver.apply_type_from_typevar(
-                            field.typ,
-                            type_from_typevar,
-                        )
-                    ),
-                    default_instance=field.default,
+            # Resolve generic types.
+            resolved_typ = _resolver.narrow_container_types(
+                _resolver.type_from_typevar_constraints(  # type: ignore
+                    _resolver.apply_type_from_typevar(
+                        field.typ,
+                        type_from_typevar,
+                    )
                 ),
+                default_instance=field.default,
             )
+            # with_typ() is a no-op when the type is unchanged, which is the common
+            # case for non-generic fields.
+            field = field.with_typ(resolved_typ)
 
             if isinstance(field.typ, TypeVar):
                 raise _instantiators.UnsupportedTypeAnnotationError(
@@ -123,12 +209,16 @@ class ParserSpecification:
                 )
 
             if _markers.Fixed not in field.markers:
+                # Prefix for any nested structures or subparsers under this field;
+                # computed once and shared below.
+                nested_prefix = _strings.make_field_name([prefix, field.name])
+
                 # (1) Handle Unions over callables; these result in subparsers.
                 subparsers_attempt = SubparsersSpecification.from_field(
                     field,
                     type_from_typevar=type_from_typevar,
                     parent_classes=parent_classes,
-                    prefix=_strings.make_field_name([prefix, field.name]),
+                    prefix=nested_prefix,
                 )
                 if subparsers_attempt is not None:
                     if subparsers_attempt.required:
@@ -138,7 +228,7 @@ class ParserSpecification:
                         and _markers.AvoidSubcommands in field.markers
                     ):
                         # Don't make a subparser.
-                        field = dataclasses.replace(field, typ=type(field.default))
+                        field = field.with_typ(type(field.default))
                     else:
                         subparsers_from_prefix[
                             subparsers_attempt.prefix
@@ -150,12 +240,8 @@ class ParserSpecification:
 
                 # (2) Handle nested callables.
                 if _fields.is_nested_type(field.typ, field.default):
-                    field = dataclasses.replace(
-                        field,
-                        typ=_resolver.narrow_type(
-                            field.typ,
-                            field.default,
-                        ),
+                    field = field.with_typ(
+                        _resolver.narrow_type(field.typ, field.default)
                     )
                     nested_parser = ParserSpecification.from_callable_or_type(
                         # Recursively apply marker types.
@@ -167,7 +253,7 @@ class ParserSpecification:
                         description=None,
                         parent_classes=parent_classes,
                         default_instance=field.default,
-                        prefix=_strings.make_field_name([prefix, field.name]),
+                        prefix=nested_prefix,
                         subcommand_prefix=subcommand_prefix,
                     )
                     if nested_parser.has_required_args:
@@ -184,13 +270,12 @@ class ParserSpecification:
                         )
 
                     # Include nested strings.
-                    for (
-                        k,
-                        v,
-                    ) in nested_parser.helptext_from_nested_class_field_name.items():
-                        helptext_from_nested_class_field_name[
-                            _strings.make_field_name([field.name, k])
-                        ] = v
+                    helptext_from_nested_class_field_name.update(
+                        (_strings.make_field_name([field.name, k]), v)
+                        for k, v in (
+                            nested_parser.helptext_from_nested_class_field_name.items()
+                        )
+                    )
 
                     if field.helptext is not None:
                         helptext_from_nested_class_field_name[
@@ -221,7 +306,7 @@ class ParserSpecification:
                 if description is not None
                 else _docstrings.get_callable_description(f)
             ),
-            args=args,
+            args=tuple(args),
             helptext_from_nested_class_field_name=helptext_from_nested_class_field_name,
             subparsers=subparsers,
             subparsers_from_prefix=subparsers_from_prefix,
@@ -282,34 +367,30 @@ class ParserSpecification:
             "": parser._action_groups[1],
             **{
                 cast(str, group.title).partition(" ")[0]: group
-                for group in parser._action_groups[2:]
+                for group in itertools.islice(parser._action_groups, 2, None)
             },
         }
         positional_group = parser._action_groups[0]
         assert positional_group.title == "positional arguments"
 
-        # Add each argument group. Note that groups with only suppressed arguments won't
-        # be added.
+        # Add each argument, creating argument groups as needed. Note that groups with
+        # only suppressed arguments won't be added. Bind methods as locals to keep
+        # attribute lookups out of the per-argument loop.
+        add_group = parser.add_argument_group
+        helptext_from_name = self.helptext_from_nested_class_field_name
         for arg in self.args:
             if (
                 arg.lowered.help is not argparse.SUPPRESS
                 and arg.dest_prefix not in group_from_prefix
             ):
-                description = self.helptext_from_nested_class_field_name.get(
-                    arg.dest_prefix
-                )
-                group_from_prefix[arg.dest_prefix] = parser.add_argument_group(
+                group_from_prefix[arg.dest_prefix] = add_group(
                     format_group_name(arg.dest_prefix),
-                    description=description,
+                    description=helptext_from_name.get(arg.dest_prefix),
                 )
 
-        # Add each argument.
-        for arg in self.args:
             if arg.field.is_positional():
                 arg.add_argument(positional_group)
-                continue
-
-            if arg.dest_prefix in group_from_prefix:
+            elif arg.dest_prefix in group_from_prefix:
                 arg.add_argument(group_from_prefix[arg.dest_prefix])
             else:
                 # Suppressed argument: still need to add them, but they won't show up in
@@ -322,6 +403,17 @@ class ParserSpecification:
 class SubparsersSpecification:
     """Structure for defining subparsers. Each subparser is a parser with a name."""
 
+    # As with ParserSpecification: skip the per-instance `__dict__`.
+    __slots__ = (
+        "name",
+        "description",
+        "parser_from_name",
+        "prefix",
+        "required",
+        "default_instance",
+        "can_be_none",
+    )
+
     name: str
     description: Optional[str]
     parser_from_name: Dict[str, ParserSpecification]
@@ -334,7 +426,7 @@ class SubparsersSpecification:
     def from_field(
         field: _fields.FieldDefinition,
         type_from_typevar: Dict[TypeVar, TypeForm[Any]],
-        parent_classes: Set[Type[Any]],
+        parent_classes: FrozenSet[Type[Any]],
         prefix: str,
     ) -> Optional[SubparsersSpecification]:
         # Union of classes should create subparsers.
@@ -342,19 +434,23 @@ class SubparsersSpecification:
         if get_origin(typ) is not Union:
             return None
 
-        # We don't use sets here to retain order of subcommands.
-        options = [
-            _resolver.apply_type_from_typevar(typ, type_from_typevar)
-            for typ in get_args(typ)
-        ]
-        options_no_none = [o for o in options if o is not type(None)]  # noqa
-        if not all(
-            [
-                _fields.is_nested_type(o, _fields.MISSING_NONPROP)
-                for o in options_no_none
-            ]
-        ):
-            return None
+        # We don't use sets here to retain order of subcommands. Options are checked
+        # as they're built: for Unions over simple types (eg Optional[int], by far the
+        # most common shape) we bail on the first option, before paying for typevar
+        # substitution or nested-type probes on the remaining ones. Substituting
+        # typevars recursively walks each option, so it's also skipped when there's
+        # nothing to substitute.
+        options = []
+        options_no_none = []
+        for option in get_args(typ):
+            if len(type_from_typevar) > 0:
+                option = _resolver.apply_type_from_typevar(option, type_from_typevar)
+            options.append(option)
+            if option is _NoneType:
+                continue
+            if not _fields.is_nested_type(option, _fields.MISSING_NONPROP):
+                return None
+            options_no_none.append(option)
 
         # Get subcommand configurations from `tyro.conf.subcommand()`.
         subcommand_config_from_name: Dict[
@@ -362,8 +458,14 @@ class SubparsersSpecification:
         ] = {}
         subcommand_name_from_default_hash: Dict[int, str] = {}
         subcommand_name_from_type: Dict[Type, str] = {}  # Used for default matching.
-        for option in options_no_none:
-            subcommand_name = _strings.subparser_name_from_type(prefix, option)
+
+        # Computing subcommand names is relatively expensive (it resolves generics and
+        # subcommand configurations); do it once per option instead of once per loop.
+        subcommand_names = [
+            _strings.subparser_name_from_type(prefix, option)
+            for option in options_no_none
+        ]
+        for option, subcommand_name in zip(options_no_none, subcommand_names):
             option, found_subcommand_configs = _resolver.unwrap_annotated(
                 option, _confstruct._SubcommandConfiguration
             )
@@ -378,10 +480,7 @@ class SubparsersSpecification:
                     0
                 ]
 
-                if (
-                    found_subcommand_configs[0].default
-                    not in _fields.MISSING_SINGLETONS
-                ):
+                if not _fields.is_missing(found_subcommand_configs[0].default):
                     default_hash = object.__hash__(found_subcommand_configs[0].default)
                     subcommand_name_from_default_hash[default_hash] = subcommand_name
 
@@ -393,10 +492,7 @@ class SubparsersSpecification:
         # If there are any required arguments in the default subparser, we should mark
         # the subparser group as a whole as required.
         default_name = None
-        if (
-            field.default is not None
-            and field.default not in _fields.MISSING_SINGLETONS
-        ):
+        if field.default is not None and not _fields.is_missing(field.default):
             # It's really hard to concretize a generic type at runtime, so we just...
             # don't. :-)
             if hasattr(type(field.default), "__parameters__"):
@@ -433,8 +529,7 @@ class SubparsersSpecification:
 
         # Add subcommands for each option.
         parser_from_name: Dict[str, ParserSpecification] = {}
-        for option in options_no_none:
-            subcommand_name = _strings.subparser_name_from_type(prefix, option)
+        for option, subcommand_name in zip(options_no_none, subcommand_names):
             option, _ = _resolver.unwrap_annotated(option)
 
             # Get a subcommand config: either pulled from the type annotations or the
@@ -477,7 +572,7 @@ class SubparsersSpecification:
             parser_from_name[subcommand_name] = subparser
 
         # Required if a default is missing.
-        required = field.default in _fields.MISSING_SINGLETONS
+        required = _fields.is_missing(field.default)
 
         # Required if a default is passed in, but the default value has missing
         # parameters.
@@ -499,7 +594,7 @@ class SubparsersSpecification:
         description_parts = []
         if field.helptext is not None:
             description_parts.append(field.helptext)
-        if not required and field.default not in _fields.MISSING_SINGLETONS:
+        if not required and not _fields.is_missing(field.default):
             description_parts.append(f" (default: {default_name})")
         description = (
             # We use `None` instead of an empty string to prevent a line break from
@@ -519,7 +614,7 @@ class SubparsersSpecification:
             prefix=prefix,
             required=required,
             default_instance=field.default,
-            can_be_none=options != options_no_none,
+            can_be_none=len(options) != len(options_no_none),
         )
 
     def apply(
@@ -2,6 +2,7 @@
 import collections.abc
 import copy
 import dataclasses
+import functools
 import sys
 import types
 from typing import (
@@ -46,11 +47,24 @@ def resolve_generic_types(
     cls: TypeOrCallable,
 ) -> Tuple[TypeOrCallable, Dict[TypeVar, TypeForm[Any]]]:
     """If the input is a class: no-op. If it's a generic alias: returns the origin
-    class, and a mapping from typevars to concrete types."""
+    class, and a mapping from typevars to concrete types.
 
+    Results are memoized; this is called repeatedly on the same types from the parser,
+    field, and docstring pipelines. Callers must treat the returned mapping as
+    read-only."""
+    try:
+        hash(cls)
+    except TypeError:
+        return _resolve_generic_types(cls)
+    return _resolve_generic_types_cached(cls)  # type: ignore
+
+
+def _resolve_generic_types(
+    cls: TypeOrCallable,
+) -> Tuple[TypeOrCallable, Dict[TypeVar, TypeForm[Any]]]:
     origin_cls = get_origin(cls)
 
-    type_from_typevar = {}
+    type_from_typevar: Dict[TypeVar, TypeForm[Any]] = {}
     if (
         # Apply some heuristics for generic types. Should revisit this.
         origin_cls is not None
@@ -59,10 +73,9 @@ def resolve_generic_types(
     ):
         typevars = origin_cls.__parameters__
         typevar_values = get_args(cls)
-        print(typevars, typevar_values, origin_cls)
         assert len(typevars) == len(typevar_values)
         cls = origin_cls
-        type_from_typevar.update(dict(zip(typevars, typevar_values)))
+        type_from_typevar.update(zip(typevars, typevar_values))
 
     if hasattr(cls, "__orig_bases__"):
         bases = getattr(cls, "__orig_bases__")
@@ -72,18 +85,32 @@ def resolve_generic_types(
                 continue
             typevars = origin_base.__parameters__
             typevar_values = get_args(base)
-            type_from_typevar.update(dict(zip(typevars, typevar_values)))
+            type_from_typevar.update(zip(typevars, typevar_values))
 
     return cls, type_from_typevar
 
 
+_resolve_generic_types_cached = functools.lru_cache(maxsize=None)(
+    _resolve_generic_types
+)
+
+
+@functools.lru_cache(maxsize=None)
+def cached_type_hints(obj: Any) -> Dict[str, Any]:
+    """Same as `typing.get_type_hints()` with `include_extras=True`, but cached.
+    Resolving annotations is expensive (each call re-evaluates annotations against
+    module globals), and the same classes and callables are inspected many times."""
+    return get_type_hints(obj, include_extras=True)
+
+
+@functools.lru_cache(maxsize=None)
 def resolved_fields(cls: TypeForm) -> List[dataclasses.Field]:
     """Similar to dataclasses.fields(), but includes dataclasses.InitVar types and
     resolves forward references."""
 
     assert dataclasses.is_dataclass(cls)
     fields = []
-    annotations = get_type_hints(cls, include_extras=True)
+    annotations = cached_type_hints(cls)  # type: ignore
     for field in getattr(cls, "__dataclass_fields__").values():
         # Avoid mutating original field.
         field = copy.copy(field)
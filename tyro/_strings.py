@@ -14,28 +14,26 @@ def _strip_dummy_field_names(parts: Iterable[str]) -> Iterable[str]:
     return filter(lambda name: len(name) > 0 and name != dummy_field_name, parts)
 
 
+@functools.lru_cache(maxsize=None)
+def _swap_delimeters(p: str) -> str:
+    """Replace all underscores in a name with hyphens, except ones at the start of the
+    string."""
+    num_underscore_prefix = 0
+    for i in range(len(p)):
+        if p[i] == "_":
+            num_underscore_prefix += 1
+        else:
+            break
+    return "_" * num_underscore_prefix + p[num_underscore_prefix:].replace("_", "-")
+
+
 def make_field_name(parts: Sequence[str]) -> str:
     """Join parts of a field name together. Used for nesting.
 
     ('parent_1', 'child') => 'parent-1.child'
     ('parents', '1', '_child_node') => 'parents.1._child-node'
     """
-    out: List[str] = []
-    for i, p in enumerate(_strip_dummy_field_names(parts)):
-        if i > 0:
-            out.append(".")
-
-        # Replace all underscores with hyphens, except ones at the start of a string.
-        num_underscore_prefix = 0
-        for i in range(len(p)):
-            if p[i] == "_":
-                num_underscore_prefix += 1
-            else:
-                break
-        p = "_" * num_underscore_prefix + p[num_underscore_prefix:].replace("_", "-")
-        out.append(p)
-
-    return "".join(out)
+    return ".".join(map(_swap_delimeters, _strip_dummy_field_names(parts)))
 
 
 def make_subparser_dest(name: str) -> str: